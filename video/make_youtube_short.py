@@ -1,7 +1,76 @@
-from moviepy.editor import VideoFileClip, concatenate_videoclips, vfx, ImageClip
+import logging
 import os
+import platform
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional
-from PIL import Image, ExifTags
+import av
+import cv2
+import numpy as np
+from PIL import Image, ImageOps
+
+log = logging.getLogger(__name__)
+
+# --- Hardware Acceleration ---
+# Software fallback: short-form social content, speed matters more than archival quality
+LIBX264_PARAMS = ["-preset", "veryfast", "-tune", "film", "-crf", "20", "-threads", "0"]
+
+# Preferred (input args, encoder, encoder params) per hardware device type, best first.
+# dxva2 only accelerates decoding, so its output encoder stays on the CPU.
+# qsv is not a generic -hwaccel for the native h264 decoder, so it only encodes.
+# Every encoder gets a quality target roughly matching libx264's -crf 20. VideoToolbox
+# only accepts -q:v on Apple Silicon, so Intel Macs get a bitrate target instead.
+HWACCEL_CANDIDATES = {
+    "cuda": (["-hwaccel", "cuda"], "h264_nvenc",
+             ["-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", "20", "-b:v", "0"]),
+    "videotoolbox": (["-hwaccel", "videotoolbox"], "h264_videotoolbox",
+                     ["-q:v", "65"] if platform.machine() == "arm64" else ["-b:v", "8M"]),
+    "qsv": ([], "h264_qsv", ["-preset", "veryfast", "-global_quality", "20"]),
+    "dxva2": (["-hwaccel", "dxva2"], "libx264", LIBX264_PARAMS),
+}
+
+def detect_hwaccel():
+    """
+    Finds the first hardware device that actually works on this machine.
+
+    Listing ffmpeg's -hwaccels/-encoders only shows what the build supports, so each
+    candidate is confirmed by encoding a single test frame on its device, with the same
+    encoder options as the final pass.
+
+    Returns:
+        tuple: (input args for -i, output video codec, output codec params).
+               Falls back to software decoding and libx264 when nothing works.
+    """
+    if sys.platform == "darwin":
+        order = ["videotoolbox"]
+    elif sys.platform == "win32":
+        order = ["cuda", "qsv", "dxva2"]
+    else:
+        order = ["cuda", "qsv"]
+
+    for device in order:
+        input_args, vcodec, params = HWACCEL_CANDIDATES[device]
+        cmd = [
+            "ffmpeg", "-hide_banner", "-nostdin", "-loglevel", "error",
+            "-init_hw_device", device,
+            "-f", "lavfi", "-i", "nullsrc=s=256x256",
+            "-frames:v", "1", "-c:v", vcodec
+        ] + params + ["-pix_fmt", "yuv420p", "-f", "null", "-"]
+        try:
+            subprocess.run(cmd, capture_output=True, check=True, timeout=30)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        # Decoded frames go back to system memory: crop/scale/fade run as CPU filters
+        return input_args, vcodec, params
+    return [], "libx264", LIBX264_PARAMS
+
+HWACCEL_IN, VCODEC_OUT, VCODEC_PARAMS = detect_hwaccel()
+
+# swscale algorithm used for every resize. Frames are converted to planar yuv420p in the
+# same swscale pass and stay in that format up to the encoder (half the bytes of rgb24)
+SCALE_ALGO = "fast_bilinear"
 
 # --- Function to Create YouTube Short ---
 # Please, find a real example of this function in the original code.
@@ -35,120 +104,110 @@ def create_youtube_short(
         image_path (str, optional): Path to an image to append at the end with fade-in/out transitions.
     """
 
-    print(f"[INFO] Starting YouTube Short creation.")
-    print(f"[INFO] Input video: {input_video_path}")
-    print(f"[INFO] Output video: {output_video_path}")
-    print(f"[INFO] Output resolution: {output_resolution}")
-    print(f"[INFO] Segments to extract: {clips_of_interest}")
-    print(f"[INFO] Speed multiplier: {speed_multiplier}")
-    print(f"[INFO] Max duration: {max_duration_sec}s")
-    print(f"[INFO] Focal points: {focal_points}")
-    print(f"[INFO] Image path: {image_path}")
+    log.info(
+        "Starting YouTube Short creation.\n"
+        "  Input video: %s\n  Output video: %s\n  Output resolution: %s\n"
+        "  Segments to extract: %s\n  Speed multiplier: %s\n  Max duration: %ss\n"
+        "  Focal points: %s\n  Image path: %s\n  Hardware decoding: %s, encoder: %s",
+        input_video_path, output_video_path, output_resolution,
+        clips_of_interest, speed_multiplier, max_duration_sec,
+        focal_points, image_path, HWACCEL_IN or "none", VCODEC_OUT
+    )
 
     try:
-        original_clip = VideoFileClip(input_video_path)
-        print(f"[INFO] Loaded video. Duration: {original_clip.duration:.2f}s, Size: {original_clip.size}")
+        original_width, original_height, fps, video_duration, has_audio = probe_video(input_video_path)
+        log.info("Loaded video. Duration: %.2fs, Size: %s", video_duration, [original_width, original_height])
     except Exception as e:
-        print(f"[ERROR] Error loading video: {e}")
+        log.error("Error loading video: %s", e)
         return
 
-    final_clips = []
+    out_w, out_h = output_resolution
+    segments = []
     current_duration = 0
 
+    crop_fn = make_crop_fn(target_aspect_ratio, (original_width, original_height))
+
     for idx, (start_sec, end_sec) in enumerate(clips_of_interest):
         if current_duration >= max_duration_sec:
-            print(f"[WARN] Max duration reached, skipping remaining clips.")
+            log.warning("Max duration reached, skipping remaining clips.")
             break
 
-        print(f"[INFO] Processing segment {idx+1}: {start_sec}-{end_sec}s")
-        sub_clip = original_clip.subclip(start_sec, end_sec)
-        sped_up_clip = sub_clip.fx(vfx.speedx, speed_multiplier)
-        print(f"[DEBUG] Segment duration after speed: {sped_up_clip.duration:.2f}s")
+        log.info("Processing segment %d: %s-%ss", idx + 1, start_sec, end_sec)
+        segment_duration = (end_sec - start_sec) / speed_multiplier
+        log.debug("Segment duration after speed: %.2fs", segment_duration)
 
         # Get focal point for this subclip, or default to center
         if focal_points and idx < len(focal_points):
             focal_point = focal_points[idx]
         else:
             focal_point = (0.5, 0.5)
-        print(f"[DEBUG] Using focal point: {focal_point}")
-
-        original_width, original_height = sped_up_clip.size
-        target_short_width_ratio, target_short_height_ratio = target_aspect_ratio
-
-        calculated_target_width = int(original_height * target_short_width_ratio / target_short_height_ratio)
-        calculated_target_height = original_height
-
-        if calculated_target_width > original_width:
-            calculated_target_width = original_width
-            calculated_target_height = int(original_width * target_short_height_ratio / target_short_width_ratio)
-
-        focal_x_pixel = original_width * focal_point[0]
-        focal_y_pixel = original_height * focal_point[1]
-
-        x1 = int(focal_x_pixel - calculated_target_width / 2)
-        y1 = int(focal_y_pixel - calculated_target_height / 2)
-        x1 = max(0, x1)
-        y1 = max(0, y1)
-        if x1 + calculated_target_width > original_width:
-            x1 = original_width - calculated_target_width
-        if y1 + calculated_target_height > original_height:
-            y1 = original_height - calculated_target_height
-        x1 = max(0, x1)
-        y1 = max(0, y1)
-
-        print(f"[DEBUG] Cropping: x1={x1}, y1={y1}, width={calculated_target_width}, height={calculated_target_height}")
-
-        cropped_clip = sped_up_clip.crop(
-            x1=x1, y1=y1,
-            width=calculated_target_width,
-            height=calculated_target_height
-        )
+        log.debug("Using focal point: %s", focal_point)
 
-        # Resize if needed
-        if cropped_clip.size != output_resolution:
-            print(f"[DEBUG] Resizing from {cropped_clip.size} to {output_resolution}")
-            cropped_clip = cropped_clip.resize(newsize=output_resolution)
-
-        if current_duration + cropped_clip.duration > max_duration_sec:
-            trim_duration = max_duration_sec - current_duration
-            print(f"[WARN] Trimming last segment to fit max duration: {trim_duration:.2f}s")
-            cropped_clip = cropped_clip.subclip(0, trim_duration)
-            if cropped_clip.duration <= 0:
-                print(f"[WARN] Skipping segment {idx+1}, duration after trim is zero.")
+        x1, y1, calculated_target_width, calculated_target_height = crop_fn(*focal_point)
+        log.debug("Cropping: x1=%d, y1=%d, width=%d, height=%d", x1, y1, calculated_target_width, calculated_target_height)
+
+        if current_duration + segment_duration > max_duration_sec:
+            segment_duration = max_duration_sec - current_duration
+            log.warning("Trimming last segment to fit max duration: %.2fs", segment_duration)
+            if segment_duration <= 0:
+                log.warning("Skipping segment %d, duration after trim is zero.", idx + 1)
                 continue
+            end_sec = start_sec + segment_duration * speed_multiplier
 
-        final_clips.append(cropped_clip)
-        current_duration += cropped_clip.duration
-        print(f"[INFO] Added segment {idx+1}, total duration so far: {current_duration:.2f}s")
+        # Fast seek on the input side, so ffmpeg only decodes from the nearest keyframe
+        input_args = HWACCEL_IN + ["-ss", str(start_sec), "-to", str(end_sec), "-i", input_video_path]
+
+        # Resize if needed
+        scale_filter = ""
+        if (calculated_target_width, calculated_target_height) != output_resolution:
+            log.debug("Resizing from %s to %s", (calculated_target_width, calculated_target_height), output_resolution)
+            scale_filter = f"scale={out_w}:{out_h}:flags={SCALE_ALGO},"
+
+        # Crop right after decoding, so only the cropped region is scaled, then retime.
+        # crop only moves plane pointers and scale+format is a single swscale pass,
+        # so every frame is read once; retiming is skipped at normal speed.
+        video_pts = "PTS-STARTPTS" if speed_multiplier == 1 else f"(PTS-STARTPTS)/{speed_multiplier}"
+        filter_graph = (
+            f"[0:v]crop={calculated_target_width}:{calculated_target_height}:{x1}:{y1},"
+            f"{scale_filter}format=yuv420p,setsar=1,setpts={video_pts}[v]"
+        )
+        if has_audio:
+            audio_tempo = "" if speed_multiplier == 1 else f",{atempo_chain(speed_multiplier)}"
+            filter_graph += f";[0:a]asetpts=PTS-STARTPTS{audio_tempo}[a]"
+        segments.append((input_args, filter_graph, None, segment_duration))
+
+        current_duration += segment_duration
+        log.info("Added segment %d, total duration so far: %.2fs", idx + 1, current_duration)
 
     # Add image at the end if provided
     if image_path and os.path.exists(image_path):
-        print(f"[INFO] Adding multiple image fades: {image_path}")
+        log.info("Adding multiple image fades: %s", image_path)
         img = auto_orient_image(image_path)
-        img.save("temp_oriented_image.jpg")
         img_w, img_h = img.size
-        out_w, out_h = output_resolution
 
-        # Scale to fit height (landscape) or width (portrait)
-        if img_w > img_h:
-            scale_factor = out_h / float(img_h)
-            new_w = int(img_w * scale_factor)
-            new_h = out_h
-        else:
-            scale_factor = out_w / float(img_w)
-            new_w = out_w
-            new_h = int(img_h * scale_factor)
+        # Scale to cover the output frame: fit height (landscape) or width (portrait)
+        scale_factor = max(out_w / float(img_w), out_h / float(img_h))
+        new_w = max(out_w, int(img_w * scale_factor))
+        new_h = max(out_h, int(img_h * scale_factor))
+
+        # Decode and resize the image once, ffmpeg receives it as a single raw frame
+        oriented_rgb = np.asarray(img)
+        base = cv2.resize(oriented_rgb, (new_w, new_h), interpolation=cv2.INTER_AREA)
+        del img, oriented_rgb
 
         num_parts = 4
         duration_per_part = 1.5  # seconds
         fade_duration = 0.2    # seconds
 
+        # Hold the frame for one part, then split it into the parts of the pan
+        part_labels = "".join(f"[s{i}]" for i in range(num_parts))
+        filter_chains = [
+            f"[0:v]tpad=stop_mode=clone:stop_duration={duration_per_part},"
+            f"trim=duration={duration_per_part},split={num_parts}{part_labels}"
+        ]
         for i in range(num_parts):
-            image_clip = ImageClip("temp_oriented_image.jpg").set_duration(duration_per_part)
-            image_clip = image_clip.resize(newsize=(new_w, new_h))
-
             # Calculate crop box for each part
-            if img_w > img_h:
+            if new_w - out_w > new_h - out_h:
                 # Landscape: move crop window horizontally
                 max_offset = new_w - out_w
                 if num_parts == 1:
@@ -165,118 +224,177 @@ def create_youtube_short(
                 else:
                     y_crop = int(i * max_offset / (num_parts - 1))
 
-            # Crop to output size, no set_position needed
-            image_clip = image_clip.crop(x1=x_crop, y1=y_crop, width=out_w, height=out_h)
-            image_clip = image_clip.fx(vfx.fadein, fade_duration).fx(vfx.fadeout, fade_duration)
-            print(f"[DEBUG] Image part {i+1}: crop=({x_crop},{y_crop}), fadein/out={fade_duration}s")
-            final_clips.append(image_clip)
-        print(f"[INFO] Added {num_parts} faded image parts as final clips.")
+            filter_chains.append(
+                f"[s{i}]crop={out_w}:{out_h}:{x_crop}:{y_crop},format=yuv420p,setsar=1,"
+                f"fade=t=in:st=0:d={fade_duration},"
+                f"fade=t=out:st={duration_per_part - fade_duration}:d={fade_duration}[p{i}]"
+            )
+            log.debug("Image part %d: crop=(%d,%d), fadein/out=%ss", i + 1, x_crop, y_crop, fade_duration)
+
+        part_outputs = "".join(f"[p{i}]" for i in range(num_parts))
+        filter_chains.append(f"{part_outputs}concat=n={num_parts}:v=1:a=0[v]")
+        image_duration = num_parts * duration_per_part
+        if has_audio:
+            # The still image has no sound: pad the audio track with silence
+            filter_chains.append(f"aevalsrc=0:d={image_duration}[a]")
+
+        input_args = ["-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{new_w}x{new_h}",
+                      "-framerate", str(fps), "-i", "-"]
+        segments.append((input_args, ";".join(filter_chains), base, image_duration))
+        # The segment list holds the only reference, so the frame is freed once rendered
+        del base
+        log.info("Added %d faded image parts as final clips.", num_parts)
 
     elif image_path:
-        print(f"[WARN] Image '{image_path}' not found. Skipping image addition.")
+        log.warning("Image '%s' not found. Skipping image addition.", image_path)
 
-    if not final_clips:
-        print("[ERROR] No clips were processed or added.")
+    if not segments:
+        log.error("No clips were processed or added.")
         return
 
-    print(f"[INFO] Concatenating {len(final_clips)} clips.")
-    final_video = concatenate_videoclips(final_clips)
-
-    # --- Adjust Aspect Ratio with Custom Focal Point ---
-    original_width, original_height = final_video.size
-    target_short_width_ratio, target_short_height_ratio = target_aspect_ratio[0], target_aspect_ratio[1]
-
-    # Calculate target dimensions that fit within the original while maintaining aspect ratio
-    # If original is 16:9 (wider) and target is 9:16 (taller)
-    # We want to maintain the original height and calculate the target width based on 9:16
-    calculated_target_width = int(original_height * target_short_width_ratio / target_short_height_ratio)
-    calculated_target_height = original_height # We aim to keep the full original height if possible
-
-    # If the calculated_target_width is wider than original (meaning original is already 9:16 or narrower)
-    # then we'd need to adjust height instead.
-    if calculated_target_width > original_width:
-        calculated_target_width = original_width
-        calculated_target_height = int(original_width * target_short_height_ratio / target_short_width_ratio)
-        # This handles cases where your source might already be vertical or square
-
-    # Calculate the crop box coordinates
-    focal_x_pixel = original_width * focal_points[0][0]
-    focal_y_pixel = original_height * focal_points[0][1]
-
-    # Calculate top-left corner (x1, y1) of the crop box
-    x1 = int(focal_x_pixel - calculated_target_width / 2)
-    y1 = int(focal_y_pixel - calculated_target_height / 2)
-
-    # Ensure crop box stays within original video boundaries
-    x1 = max(0, x1) # Don't go left of 0
-    y1 = max(0, y1) # Don't go above 0
-
-    # Adjust x1, y1 if cropping would extend beyond the right/bottom edge
-    if x1 + calculated_target_width > original_width:
-        x1 = original_width - calculated_target_width
-    if y1 + calculated_target_height > original_height:
-        y1 = original_height - calculated_target_height
-
-    # Ensure x1, y1 are not negative after adjustments (should already be covered by max(0, x1/y1) but good for robustness)
-    x1 = max(0, x1)
-    y1 = max(0, y1)
-
+    log.info("Final Short duration: %.2f seconds, resolution: %dx%d",
+             sum(duration for *_, duration in segments), out_w, out_h)
+
+    # Segments are independent: render them concurrently to lossless intermediates,
+    # then join them and run the expensive final encode only once
+    with tempfile.TemporaryDirectory() as temp_dir:
+        jobs = [
+            (input_args, filter_graph, input_frame, has_audio, fps, os.path.join(temp_dir, f"segment_{idx:03d}.mkv"))
+            for idx, (input_args, filter_graph, input_frame, _) in enumerate(segments)
+        ]
+        try:
+            log.info("Rendering %d clips in parallel.", len(jobs))
+            # Each worker just waits on its own ffmpeg process, so threads are enough
+            with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+                segment_paths = list(executor.map(render_segment, jobs))
+            # Drop the last references to the rendered image frame before the long final encode
+            segments.clear()
+            jobs.clear()
+
+            log.info("Concatenating %d clips.", len(segment_paths))
+            concat_list_path = os.path.join(temp_dir, "concat.txt")
+            with open(concat_list_path, "w") as concat_list:
+                for segment_path in segment_paths:
+                    escaped_path = segment_path.replace("'", "'\\''")
+                    concat_list.write(f"file '{escaped_path}'\n")
+
+            input_cmd = ["ffmpeg", "-y", "-hide_banner", "-nostdin", "-f", "concat", "-safe", "0", "-i", concat_list_path]
+            output_args = ["-pix_fmt", "yuv420p", "-movflags", "+faststart"]
+            if has_audio:
+                output_args += ["-c:a", "aac"]
+            output_args.append(output_video_path)
+            try:
+                subprocess.run(input_cmd + ["-c:v", VCODEC_OUT] + VCODEC_PARAMS + output_args, check=True)
+            except subprocess.CalledProcessError as e:
+                if VCODEC_OUT == "libx264":
+                    raise
+                # The lossless segments are still on disk: retry once in software
+                log.warning("%s encode failed (exit status %s), retrying with libx264.", VCODEC_OUT, e.returncode)
+                subprocess.run(input_cmd + ["-c:v", "libx264"] + LIBX264_PARAMS + output_args, check=True)
+            log.info("YouTube Short successfully created at: %s", output_video_path)
+        except (OSError, subprocess.CalledProcessError) as e:
+            log.error("Error writing video file: %s", e)
+
+def make_crop_fn(aspect, size):
+    """
+    Specializes the crop-box computation for a fixed aspect ratio and source frame size.
 
-    # Perform the crop
-    final_video = final_video.crop(x1=x1, y1=y1,
-                                   width=calculated_target_width,
-                                   height=calculated_target_height)
+    Args:
+        aspect (tuple): (width, height) target aspect ratio, e.g. (9, 16).
+        size (tuple): (width, height) of the source frames.
 
-    # Optional: Resize to a standard Short resolution (e.g., 1080x1920) if it's not already
-    # This might be needed if original_height was lower than 1920, for example.
-    # We maintain aspect ratio, so only need to set one dimension.
-    target_short_res_height = output_resolution[1]
-    target_short_res_width = output_resolution[0]
-    if final_video.h != target_short_res_height or final_video.w != target_short_res_width:
-        final_video = final_video.resize(newsize=output_resolution)
+    Returns:
+        callable: crop(x_ratio, y_ratio) -> (x1, y1, width, height), with the box kept inside the frame.
+    """
+    aspect_w, aspect_h = aspect
+    width, height = size
+
+    # Keep the full height if possible, otherwise (source already vertical) keep the full width
+    crop_w = int(height * aspect_w / aspect_h)
+    crop_h = height
+    if crop_w > width:
+        crop_w = width
+        crop_h = int(width * aspect_h / aspect_w)
+    half_w, half_h = crop_w / 2, crop_h / 2
+    max_x, max_y = width - crop_w, height - crop_h
+
+    def crop(x_ratio, y_ratio):
+        x1 = min(max(int(width * x_ratio - half_w), 0), max_x)
+        y1 = min(max(int(height * y_ratio - half_h), 0), max_y)
+        return x1, y1, crop_w, crop_h
+
+    return crop
+
+def render_segment(segment):
+    """
+    Renders a single segment of the Short to a lossless FFV1/PCM intermediate file.
 
+    Args:
+        segment (tuple): (input_args, filter_graph, input_frame, has_audio, fps, output_path), where the
+                         filter graph exposes its result as [v] (and [a] when has_audio is True).
+                         input_frame is an optional RGB array sent to ffmpeg's stdin.
 
-    print(f"Final Short duration: {final_video.duration:.2f} seconds")
-    print(f"Final Short resolution: {final_video.size[0]}x{final_video.size[1]}")
+    Returns:
+        str: Path of the rendered segment.
+    """
+    input_args, filter_graph, input_frame, has_audio, fps, output_path = segment
+    cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error"]
+    if input_frame is None:
+        cmd.append("-nostdin")
+    cmd += input_args
+    cmd += ["-filter_complex", filter_graph, "-map", "[v]"]
+    if has_audio:
+        # Same audio layout in every segment, so the concat demuxer can join the streams
+        cmd += ["-map", "[a]", "-c:a", "pcm_s16le", "-ar", "48000", "-ac", "2"]
+    # Intra-only lossless encoding is cheap, the real encode happens once after the join
+    cmd += ["-c:v", "ffv1", "-level", "3", "-threads", "2", "-pix_fmt", "yuv420p", "-r", str(fps), output_path]
+    input_data = input_frame.tobytes() if input_frame is not None else None
+    subprocess.run(cmd, input=input_data, check=True)
+    return output_path
+
+def probe_video(video_path):
+    """
+    Reads the basic properties of a video through PyAV's libav bindings.
 
-    # Write the output video
-    try:
-        final_video.write_videofile(
-            output_video_path,
-            codec="libx264",
-            audio_codec="aac",
-            fps=original_clip.fps
-        )
-        print(f"YouTube Short successfully created at: {output_video_path}")
-    except Exception as e:
-        print(f"Error writing video file: {e}")
-    finally:
-        original_clip.close()
-        for clip in final_clips:
-            clip.close()
-        final_video.close()
+    Returns:
+        tuple: (width, height, fps, duration_sec, has_audio)
+    """
+    with av.open(video_path) as container:
+        video_stream = container.streams.video[0]
+        fps = float(video_stream.average_rate)
+        if container.duration is not None:
+            duration = container.duration / av.time_base
+        else:
+            duration = float(video_stream.duration * video_stream.time_base)
+        return video_stream.width, video_stream.height, fps, duration, bool(container.streams.audio)
+
+def atempo_chain(speed_multiplier):
+    # Each atempo filter only accepts factors in [0.5, 2.0], so larger changes are chained
+    factors = []
+    while speed_multiplier > 2.0:
+        factors.append(2.0)
+        speed_multiplier /= 2.0
+    while speed_multiplier < 0.5:
+        factors.append(0.5)
+        speed_multiplier /= 0.5
+    factors.append(speed_multiplier)
+    return ",".join(f"atempo={factor}" for factor in factors)
 
 def auto_orient_image(image_path):
     img = Image.open(image_path)
     try:
-        for orientation in ExifTags.TAGS.keys():
-            if ExifTags.TAGS[orientation] == 'Orientation':
-                break
-        exif = img._getexif()
-        if exif is not None:
-            orientation_value = exif.get(orientation, None)
-            if orientation_value == 3:
-                img = img.rotate(180, expand=True)
-            elif orientation_value == 6:
-                img = img.rotate(270, expand=True)
-            elif orientation_value == 8:
-                img = img.rotate(90, expand=True)
+        # Applies all 8 EXIF orientations (rotations and mirrored ones)
+        img = ImageOps.exif_transpose(img)
     except Exception:
+        # Malformed EXIF: keep the image as it is
         pass
-    return img
+    # JPEGs may also be CMYK
+    return img.convert("RGB")
 
 # --- Example Usage with a Custom Focal Point ---
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
     input_video = "Sunset with clouds - watercolor painting n1.mp4" # <--- Change this to your input video
     output_short = "SunsetWithClouds_short2.mp4" # <--- Desired output filename
 
@@ -335,7 +453,7 @@ if __name__ == "__main__":
         equal_segments.append((start, start + segment_length))
 
     if not os.path.exists(input_video):
-        print(f"Error: Input video '{input_video}' not found. Please provide a valid path.")
+        log.error("Input video '%s' not found. Please provide a valid path.", input_video)
     else:
         create_youtube_short(
             input_video_path=input_video,